@@ -4,18 +4,43 @@ A comprehensive habit and task tracking application with data visualization.
 """
 
 import customtkinter as ctk
+from collections import OrderedDict, deque
 from datetime import datetime, timedelta
 import json
+import os
 from pathlib import Path
 import logging
+import threading
+from tkinter import filedialog, messagebox
 import warnings
-import io
+import numpy as np
 from PIL import Image
 import matplotlib
 from matplotlib.figure import Figure
 
-# Configure matplotlib before using
-matplotlib.use('TkAgg')
+# Configure matplotlib before using (figures are rasterized off-screen, no FigureCanvasTkAgg needed)
+matplotlib.use('Agg')
+from matplotlib import font_manager
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.font_manager import FontProperties
+from matplotlib.patches import Wedge
+
+# Fixed font and cheap path settings so figures skip font fallback lookups and autolayout
+CHART_FONT_FAMILY = 'DejaVu Sans'
+matplotlib.rcParams.update({
+    'font.family': CHART_FONT_FAMILY,
+    'text.hinting': 'no_hinting',
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000,
+    'figure.autolayout': False,
+})
+
+# orjson is optional: it is much faster than the stdlib json, which stays as a fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Suppress matplotlib warnings
 warnings.filterwarnings('ignore')
@@ -59,6 +84,44 @@ DARK_MODE = {
 
 DATA_FILE = Path("tracker_data.json")
 
+# Write buffer for saving the data file
+SAVE_BUFFER_SIZE = 128 * 1024
+
+# Maximum number of rendered chart images kept in memory (LRU)
+CHART_CACHE_SIZE = 64
+
+# Delay used to coalesce rapid edits into a single save
+SAVE_DEBOUNCE_MS = 500
+
+# Daily donut geometry (pixels): canvas size, outer radius and ring thickness
+DONUT_SIZE = 170
+DONUT_RADIUS = 80
+DONUT_RING = 28
+
+# CTk widget options that may carry a theme color
+THEMED_OPTIONS = ("fg_color", "bg_color", "text_color", "border_color", "hover_color",
+                  "button_color", "progress_color", "checkmark_color")
+
+# Chart groups rendered by the idle queue, in priority order
+CHART_QUEUE_ITEMS = ("bar", "weekly_overall", "donuts", "habits")
+TASK_CHARTS = ("bar", "weekly_overall", "donuts")
+WEEK_CHARTS = ("bar", "weekly_overall")
+HABIT_CHARTS = ("habits",)
+
+
+def json_loads(raw):
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode('utf-8'))
+
+
+def json_dumps(data):
+    """Serialize data to compact UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False).encode('utf-8')
+
 
 class ThemeManager:
     """Manages application theme switching between light and dark modes."""
@@ -66,10 +129,13 @@ class ThemeManager:
     def __init__(self):
         self.current_theme = "light"
 
+    def palette(self):
+        """Get the color mapping of the current theme."""
+        return LIGHT_MODE if self.current_theme == "light" else DARK_MODE
+
     def get(self, key):
         """Get color value for current theme."""
-        theme = LIGHT_MODE if self.current_theme == "light" else DARK_MODE
-        return theme.get(key, "#000000")
+        return self.palette().get(key, "#000000")
 
     def toggle(self):
         """Toggle between light and dark theme."""
@@ -89,43 +155,67 @@ class DataManager:
         """Load data from JSON file."""
         try:
             if DATA_FILE.exists():
-                with open(DATA_FILE, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return json_loads(DATA_FILE.read_bytes())
         except Exception as e:
             logger.error(f"Error loading data: {e}")
         return {}
     
     @staticmethod
     def save_data(data):
-        """Save data to JSON file."""
+        """Save data to JSON file (compact, written atomically via a temp file)."""
         try:
-            with open(DATA_FILE, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            tmp_file = DATA_FILE.with_suffix('.tmp')
+            with open(tmp_file, 'wb', buffering=SAVE_BUFFER_SIZE) as f:
+                f.write(json_dumps(data))
+            os.replace(tmp_file, DATA_FILE)
             logger.info("Data saved successfully")
             return True
         except Exception as e:
             logger.error(f"Error saving data: {e}")
             return False
-    
+
     @staticmethod
     def get_week_start(date):
         """Get the start date of the week (Monday)."""
         return date - timedelta(days=date.weekday())
+
+    @staticmethod
+    def week_dates(week_start):
+        """Get the seven YYYY-MM-DD date keys of the week starting at week_start."""
+        if isinstance(week_start, datetime):
+            week_start = week_start.date()
+        # date.isoformat is the same format as strftime("%Y-%m-%d") without the locale round trip
+        return tuple((week_start + timedelta(days=i)).isoformat() for i in range(7))
     
     @staticmethod
     def calculate_habit_completion_rate(daily_data, habit, week_start):
         """Calculate completion rate for a habit across the week."""
-        completed = 0
-        for i in range(7):
-            date = (week_start + timedelta(days=i)).strftime("%Y-%m-%d")
-            if date in daily_data and habit in daily_data[date].get("habits", {}):
-                if daily_data[date]["habits"][habit]:
-                    completed += 1
-        return (completed / 7) * 100
+        dates = DataManager.week_dates(week_start)
+        done = np.fromiter(
+            (daily_data.get(d, {}).get("habits", {}).get(habit, False) for d in dates),
+            dtype=np.bool_, count=7
+        )
+        return done.mean() * 100
 
 
 class TrackerApp(ctk.CTk):
     """Main habit tracking application."""
+
+    # Shared UI fonts, created once in __init__ (a Tk root must exist first)
+    FONT_H1 = None
+    FONT_10 = None
+    FONT_11 = None
+    FONT_BOLD_12 = None
+    FONT_13 = None
+    FONT_BOLD_13 = None
+    FONT_14 = None
+    FONT_BOLD_14 = None
+    FONT_ITALIC_14 = None
+    FONT_16 = None
+    FONT_BOLD_16 = None
+    FONT_18 = None
+    FONT_BOLD_18 = None
+    FONT_BOLD_20 = None
     
     def __init__(self):
         super().__init__()
@@ -146,6 +236,7 @@ class TrackerApp(ctk.CTk):
             logger.error(f"Maximize error: {e}")
             
         ctk.set_appearance_mode("light")
+        self.create_fonts()
 
         # Suppress benign Tkinter errors that happen during widget destruction
         import tkinter
@@ -160,6 +251,13 @@ class TrackerApp(ctk.CTk):
         self.report_callback_exception = custom_exception_handler
 
         self.theme = ThemeManager()
+        self._matrices_dirty = False
+
+        # Shared chart fonts; resolved once in the background before the first chart renders
+        self._fp = FontProperties(family=CHART_FONT_FAMILY, size=11, weight='bold')
+        self._fp_axis = FontProperties(family=CHART_FONT_FAMILY, size=12, weight='bold')
+        self._fp_large = FontProperties(family=CHART_FONT_FAMILY, size=20, weight='bold')
+        threading.Thread(target=font_manager.findfont, args=(self._fp,), daemon=True).start()
         
         # Load data
         stored_data = DataManager.load_data()
@@ -174,48 +272,146 @@ class TrackerApp(ctk.CTk):
             "Ingliz tili"
         ])
         self.task_templates = stored_data.get('task_templates', ["Vazifa 1", "Vazifa 2", "Vazifa 3", "Vazifa 4", "Vazifa 5"])
+        # Membership lookups; habits and day tasks use the matrix indexes for the same purpose
+        self._task_templates_set = set(self.task_templates)
         
         self.week_start_date = DataManager.get_week_start(datetime.now())
+        self._recompute_week_dates()
         self.initialize_week_data()
+        # Tasks across all stored days, so emptiness checks need no scan of daily_data
+        self._total_task_count = sum(len(day["tasks"]) for day in self.daily_data.values())
+        self._load_habit_matrix()
+        self._load_task_matrices()
 
         # UI elements store
-        self.week_charts = {}
-        self.week_image_labels = {}
+        self.week_canvases = {}
         self.bar_chart_fig = None
         self.bar_chart_image_label = None
+        self.export_button = None
+        self._pd = None
+        self.bar_rects = []
+        self.bar_texts = []
+        self._bar_bg = None
         self.weekly_overall_chart_fig = None
         self.weekly_overall_chart_image_label = None
         self.daily_stats_labels = {}
         self.habit_vars = {}
         self.habit_progress_labels = {}
         self.habit_progress_bars = {}
+        self._habit_last_percent = {}
+        self._habits_page_size = 15
+        self._habits_page = 0
+        self._day_placeholders = []
+        self._day_materialized = []
         self.weekly_percent_label = None
         self.weekly_stats_containers = {}
 
+        # Rendered chart images keyed by the data they show, evicted LRU
+        self._chart_cache = OrderedDict()
+        # Data shown by each live chart widget; unchanged keys skip the redraw
+        self._last_chart_keys = {}
+        self._last_stats = None
+        self._save_pending = None
+        self._chart_queue = deque()
+        self._visible = True
+        self._chart_dirty = False
+        self._charts_rendered = False
+
         self.setup_ui()
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.bind("<Map>", self._on_map, add="+")
+        self.bind("<Unmap>", self._on_unmap, add="+")
+        self.bind("<FocusIn>", self._on_focus_in, add="+")
         
         # Lazy load charts to significantly improve startup time
         logger.info("UI structure created, deferring chart generation...")
-        self.after(100, self.update_all_charts)
+        self._queue_chart_updates()
+
+    def create_fonts(self):
+        """Create the shared fonts once so widgets don't each build their own Tk font."""
+        self.FONT_H1 = ctk.CTkFont(family="Helvetica", size=40, weight="bold")
+        self.FONT_10 = ctk.CTkFont(family="Helvetica", size=10)
+        self.FONT_11 = ctk.CTkFont(family="Helvetica", size=11)
+        self.FONT_BOLD_12 = ctk.CTkFont(family="Helvetica", size=12, weight="bold")
+        self.FONT_13 = ctk.CTkFont(family="Helvetica", size=13)
+        self.FONT_BOLD_13 = ctk.CTkFont(family="Helvetica", size=13, weight="bold")
+        self.FONT_14 = ctk.CTkFont(family="Helvetica", size=14)
+        self.FONT_BOLD_14 = ctk.CTkFont(family="Helvetica", size=14, weight="bold")
+        self.FONT_ITALIC_14 = ctk.CTkFont(family="Helvetica", size=14, slant="italic")
+        self.FONT_16 = ctk.CTkFont(family="Helvetica", size=16)
+        self.FONT_BOLD_16 = ctk.CTkFont(family="Helvetica", size=16, weight="bold")
+        self.FONT_18 = ctk.CTkFont(family="Helvetica", size=18)
+        self.FONT_BOLD_18 = ctk.CTkFont(family="Helvetica", size=18, weight="bold")
+        self.FONT_BOLD_20 = ctk.CTkFont(family="Helvetica", size=20, weight="bold")
+
+    def _recompute_week_dates(self):
+        """Cache the date keys of the current week; call whenever week_start_date changes."""
+        self._week_dates = DataManager.week_dates(self.week_start_date)
 
     def initialize_week_data(self):
         """Initialize data structure for all days in the week."""
-        for i in range(7):
-            date = (self.week_start_date + timedelta(days=i)).strftime("%Y-%m-%d")
+        self._date_index = {d: i for i, d in enumerate(self._week_dates)}
+        habit_defaults = dict.fromkeys(self.habits, False)
+        task_defaults = dict.fromkeys(self.task_templates, False)
+        for date in self._week_dates:
             if date not in self.daily_data:
                 self.daily_data[date] = {
                     "tasks": self.task_templates.copy(),
-                    "task_status": {t: False for t in self.task_templates},
-                    "habits": {h: False for h in self.habits}
+                    "task_status": task_defaults.copy(),
+                    "habits": habit_defaults.copy()
                 }
             else:
-                # Ensure all habits are in the data
-                for habit in self.habits:
-                    if habit not in self.daily_data[date]["habits"]:
-                        self.daily_data[date]["habits"][habit] = False
+                # Ensure all habits are in the data (stored values win over the defaults)
+                self.daily_data[date]["habits"] = habit_defaults | self.daily_data[date]["habits"]
+
+    def _load_habit_matrix(self):
+        """Build the (day, habit) completion matrix for this week from daily_data."""
+        self._habit_index = {h: i for i, h in enumerate(self.habits)}
+        self._habit_mat = np.zeros((7, len(self.habits)), dtype=np.uint8)
+        habit_names = self.habits
+        for d_idx, date in enumerate(self._week_dates):
+            habits = self.daily_data[date]["habits"]
+            self._habit_mat[d_idx] = np.fromiter((habits.get(h, False) for h in habit_names),
+                                                 dtype=np.uint8, count=len(habit_names))
+
+    def _load_task_matrices(self):
+        """Build one task completion vector per week day from daily_data."""
+        self._task_index = {}
+        self._task_mat = {}
+        self._daily_completed = {}
+        self._daily_total = {}
+        for d_idx, date in enumerate(self._week_dates):
+            day = self.daily_data[date]
+            tasks = day["tasks"]
+            status = day["task_status"]
+            self._task_index[d_idx] = {t: i for i, t in enumerate(tasks)}
+            self._task_mat[d_idx] = np.fromiter((status.get(t, False) for t in tasks),
+                                                dtype=np.uint8, count=len(tasks))
+            # Per-day counters, kept up to date by update_task so charts read them in O(1)
+            self._daily_completed[date] = int(self._task_mat[d_idx].sum())
+            self._daily_total[date] = len(tasks)
+
+    def _store_matrices(self):
+        """Write checkbox state held in the matrices back into daily_data."""
+        if not self._matrices_dirty:
+            return
+        daily_data = self.daily_data
+        habit_items = list(self._habit_index.items())
+        for d_idx, date in enumerate(self._week_dates):
+            day = daily_data[date]
+            habits = day["habits"]
+            habit_row = self._habit_mat[d_idx].tolist()
+            for habit, h_idx in habit_items:
+                habits[habit] = bool(habit_row[h_idx])
+            status = day["task_status"]
+            task_row = self._task_mat[d_idx].tolist()
+            for task, t_idx in self._task_index[d_idx].items():
+                status[task] = bool(task_row[t_idx])
+        self._matrices_dirty = False
 
     def save_data(self):
         """Save current application state to file."""
+        self._store_matrices()
         data = {
             'daily_data': self.daily_data,
             'habits': self.habits,
@@ -223,6 +419,59 @@ class TrackerApp(ctk.CTk):
         }
         DataManager.save_data(data)
 
+    def _schedule_save(self):
+        """Save shortly after the last change instead of on every single edit."""
+        if self._save_pending:
+            self.after_cancel(self._save_pending)
+        self._save_pending = self.after(SAVE_DEBOUNCE_MS, self._flush_save)
+
+    def _flush_save(self):
+        """Write a pending debounced save to disk."""
+        self._save_pending = None
+        self.save_data()
+
+    def on_close(self):
+        """Flush unsaved changes before the window is closed."""
+        if self._save_pending:
+            self.after_cancel(self._save_pending)
+            self._flush_save()
+        self.destroy()
+
+    def _on_map(self, event):
+        """Resume chart rendering when the window is shown again."""
+        if event.widget is not self:
+            return
+        self._visible = True
+        self._flush_dirty_charts()
+
+    def _on_unmap(self, event):
+        """Pause chart rendering while the window is minimized."""
+        if event.widget is self:
+            self._visible = False
+
+    def _on_focus_in(self, event):
+        """Catch up on chart updates skipped while the window was in the background."""
+        self._flush_dirty_charts()
+
+    def _charts_visible(self):
+        """Whether the window is mapped, i.e. worth redrawing charts for."""
+        if not self._visible:
+            return False
+        # The first render must never wait for focus (the window may open unfocused)
+        if not self._charts_rendered:
+            return True
+        # After that, redraws for a background window are deferred until it gets focus again
+        try:
+            return self.focus_get() is not None
+        except KeyError:
+            return True
+
+    def _flush_dirty_charts(self):
+        """Redraw charts that were skipped while the window was hidden."""
+        if self._chart_dirty and self._charts_visible():
+            self._chart_dirty = False
+            self._queue_chart_updates()
+
     def setup_ui(self):
         """Setup main UI layout with professional structure."""
         try:
@@ -248,7 +497,6 @@ class TrackerApp(ctk.CTk):
             self.create_add_items_section(main)
         except Exception as e:
             logger.error(f"Error setting up UI: {e}")
-            import tkinter.messagebox as messagebox
             messagebox.showerror("Kritik Xatolik", f"Dastur interfeysini qurishda xatolik yuz berdi. Dasturni qayta pusk qiling. Xato: {e}")
 
     def create_header(self, parent):
@@ -262,19 +510,19 @@ class TrackerApp(ctk.CTk):
 
         ctk.CTkLabel(
             left, text="📊 Haftalik Odatlar Kuzatuvchisi",
-            font=("Helvetica", 40, "bold"),
+            font=self.FONT_H1,
             text_color=self.theme.get("accent")
         ).pack(anchor="w")
 
         ctk.CTkLabel(
             left, text="Professional Habit Tracking Dashboard",
-            font=("Helvetica", 18),
+            font=self.FONT_18,
             text_color=self.theme.get("text")
         ).pack(anchor="w", pady=(2, 0))
 
         ctk.CTkLabel(
             left, text="👨‍💻 Dasturchi: Valijon Ergashev | 📞 Tel: +998 77 342 33 21",
-            font=("Helvetica", 14, "italic"),
+            font=self.FONT_ITALIC_14,
             text_color=self.theme.get("text")
         ).pack(anchor="w", pady=(2, 0))
 
@@ -282,17 +530,18 @@ class TrackerApp(ctk.CTk):
         btn_frame = ctk.CTkFrame(header, fg_color="transparent")
         btn_frame.pack(side="right")
 
-        ctk.CTkButton(
+        self.export_button = ctk.CTkButton(
             btn_frame, text="📥 Excel ga yuklash", width=160, height=50,
-            font=("Helvetica", 14, "bold"),
+            font=self.FONT_BOLD_14,
             fg_color=self.theme.get("accent"),
             hover_color=self.theme.get("accent_light"),
             command=self.export_to_excel
-        ).pack(side="left", padx=5)
+        )
+        self.export_button.pack(side="left", padx=5)
 
         ctk.CTkButton(
             btn_frame, text="🌙 Mavzu", width=120, height=50,
-            font=("Helvetica", 14, "bold"),
+            font=self.FONT_BOLD_14,
             fg_color=self.theme.get("accent"),
             hover_color=self.theme.get("accent_light"),
             command=self.toggle_theme_action
@@ -300,7 +549,7 @@ class TrackerApp(ctk.CTk):
 
         ctk.CTkButton(
             btn_frame, text="💾 Saqlash", width=120, height=50,
-            font=("Helvetica", 14, "bold"),
+            font=self.FONT_BOLD_14,
             fg_color=self.theme.get("accent"),
             hover_color=self.theme.get("accent_light"),
             command=self.save_data
@@ -314,7 +563,7 @@ class TrackerApp(ctk.CTk):
 
         ctk.CTkLabel(
             frame, text="📊 Kunlik Ko'rsatkichlar",
-            font=("Helvetica", 18, "bold"),
+            font=self.FONT_BOLD_18,
             text_color=self.theme.get("accent")
         ).pack(anchor="w", padx=15, pady=(15, 10))
 
@@ -323,8 +572,16 @@ class TrackerApp(ctk.CTk):
 
         days_uz = ["Dushanba", "Seshanba", "Chorshanba", "Payshanba", "Juma", "Shanba", "Yakshanba"]
 
-        for i in range(7):
-            date = (self.week_start_date + timedelta(days=i)).strftime("%Y-%m-%d")
+        # A raw canvas is not scaled by CTk, so apply the widget scaling to its geometry and font
+        scale = ctk.ScalingTracker.get_widget_scaling(self)
+        size = round(DONUT_SIZE * scale)
+        ring = round(DONUT_RING * scale)
+        pad = round(3 * scale)
+        inset = (size - 2 * round(DONUT_RADIUS * scale) + ring) / 2
+        bbox = (inset, inset, size - inset, size - inset)
+        font = self.FONT_BOLD_12.create_scaled_tuple(scale)
+
+        for i, date in enumerate(self._week_dates):
             day = days_uz[i]
 
             # Day box
@@ -344,20 +601,21 @@ class TrackerApp(ctk.CTk):
             # Date label
             ctk.CTkLabel(
                 header_frame, text=f"{day}\n{date}",
-                font=("Helvetica", 12, "bold"),
+                font=self.FONT_BOLD_12,
                 text_color=self.theme.get("accent")
             ).pack(side="left", expand=True)
 
-            # Mini donut chart
-            fig = Figure(figsize=(2, 2), dpi=100)
-            ax = fig.add_subplot(111)
-            fig.patch.set_facecolor(self.theme.get("bg"))
-            self.week_charts[date] = (fig, ax)
-
-            # Image Label to avoid TkCanvas scrolling bugs
-            lbl = ctk.CTkLabel(day_box, text="")
-            lbl.pack(fill="both", expand=True, padx=3, pady=3)
-            self.week_image_labels[date] = lbl
+            # Mini donut drawn as two canvas arcs; updates only change their extents
+            canvas = ctk.CTkCanvas(day_box, width=size, height=size,
+                                   bg=self.theme.get("bg"), highlightthickness=0)
+            canvas.pack(padx=pad, pady=pad)
+            arc_done = canvas.create_arc(*bbox, start=90, extent=0, style="arc", state="hidden",
+                                         width=ring, outline=self.theme.get("accent"))
+            arc_rest = canvas.create_arc(*bbox, start=90, extent=-360, style="arc",
+                                         width=ring, outline=self.theme.get("border"))
+            text_id = canvas.create_text(size / 2, size / 2, text="0%",
+                                         font=font, fill=self.theme.get("accent"))
+            self.week_canvases[date] = (canvas, arc_done, arc_rest, text_id)
 
     def create_bar_chart_section(self, parent):
         """Create bar chart showing overall weekly progress with weekly stats side by side."""
@@ -377,27 +635,18 @@ class TrackerApp(ctk.CTk):
 
         ctk.CTkLabel(
             left_frame, text="📈 Umumiy O'sish",
-            font=("Helvetica", 16, "bold"),
+            font=self.FONT_BOLD_16,
             text_color=self.theme.get("accent")
         ).pack(anchor="w", padx=15, pady=(15, 10))
 
         # Calculate actual completion rates
         days = ['Du', 'Se', 'Ch', 'Pa', 'Ju', 'Sh', 'Ya']
-        completed_counts = []
-
-        for i in range(7):
-            date = (self.week_start_date + timedelta(days=i)).strftime("%Y-%m-%d")
-            if date in self.daily_data:
-                tasks = self.daily_data[date]["tasks"]
-                completed = sum(1 for t in tasks if self.daily_data[date]["task_status"].get(t, False))
-                total = len(tasks) if tasks else 1
-                percent = int((completed / total) * 100)
-            else:
-                percent = 0
-            completed_counts.append(percent)
+        stats = self._compute_week_stats()
+        completed_counts = stats["per_day"].tolist()
 
         # Create bar chart
         fig = Figure(figsize=(7, 3.5), dpi=100)
+        fig._agg_canvas = FigureCanvasAgg(fig)
         ax = fig.add_subplot(111)
         fig.patch.set_facecolor(self.theme.get("frame"))
         
@@ -405,8 +654,8 @@ class TrackerApp(ctk.CTk):
                      alpha=0.85, edgecolor=self.theme.get("accent_light"), linewidth=2)
         
         ax.set_ylim(0, 110)
-        ax.set_ylabel("Foiz (%)", fontsize=12, fontweight='bold')
-        ax.set_xlabel("Hafta kunlari", fontsize=12, fontweight='bold')
+        ax.set_ylabel("Foiz (%)", fontproperties=self._fp_axis)
+        ax.set_xlabel("Hafta kunlari", fontproperties=self._fp_axis)
         ax.spines['top'].set_visible(False)
         ax.spines['right'].set_visible(False)
         ax.spines['left'].set_color(self.theme.get("border"))
@@ -414,16 +663,26 @@ class TrackerApp(ctk.CTk):
         ax.grid(axis='y', alpha=0.3, linestyle='--')
 
         # Add percentage labels on bars
+        self.bar_texts = []
         for bar in bars:
             height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height + 2,
-                    f'{int(height)}%', ha='center', va='bottom', 
-                    fontsize=11, fontweight='bold', color=self.theme.get("accent"))
+            label = ax.text(bar.get_x() + bar.get_width()/2., height + 2,
+                            f'{int(height)}%', ha='center', va='bottom', 
+                            fontproperties=self._fp, color=self.theme.get("accent"))
+            self.bar_texts.append(label)
+        self.bar_rects = list(bars)
+
+        # Bars and labels are blitted over a cached background on updates
+        for artist in self.bar_rects + self.bar_texts:
+            artist.set_animated(True)
+        self._bar_bg = None
 
         ax.set_facecolor(self.theme.get("frame"))
+        fig.tight_layout()
         self.bar_chart_fig = fig
         
-        # Image Label to avoid TkCanvas scrolling bugs
+        # Shown as a label image: an embedded FigureCanvasTkAgg re-renders the whole figure
+        # on every resize and draw, which would bypass the blit path and the image cache
         self.bar_chart_image_label = ctk.CTkLabel(left_frame, text="")
         self.bar_chart_image_label.pack(fill="both", expand=True, padx=10, pady=10)
 
@@ -439,21 +698,13 @@ class TrackerApp(ctk.CTk):
 
         ctk.CTkLabel(
             right_frame, text="📊 Haftalik Vazifalar",
-            font=("Helvetica", 18, "bold"),
+            font=self.FONT_BOLD_18,
             text_color=self.theme.get("accent")
         ).pack(anchor="w", padx=15, pady=(15, 10))
 
-        # Calculate overall weekly stats
-        total_tasks = 0
-        completed_tasks = 0
-        for i in range(7):
-            date = (self.week_start_date + timedelta(days=i)).strftime("%Y-%m-%d")
-            if date in self.daily_data:
-                tasks = self.daily_data[date]["tasks"]
-                total_tasks += len(tasks)
-                completed_tasks += sum(1 for t in tasks if self.daily_data[date]["task_status"].get(t, False))
-
-        weekly_percent = int((completed_tasks / total_tasks * 100)) if total_tasks > 0 else 0
+        # Overall weekly stats
+        total_tasks = stats["weekly_total"]
+        completed_tasks = stats["weekly_done"]
 
         # Big circular progress display
         stats_container = ctk.CTkFrame(right_frame, fg_color="transparent")
@@ -461,15 +712,30 @@ class TrackerApp(ctk.CTk):
 
         # Overall percentage in a circular donut chart
         self.weekly_overall_chart_fig = Figure(figsize=(2, 2), dpi=100)
+        self.weekly_overall_chart_fig._agg_canvas = FigureCanvasAgg(self.weekly_overall_chart_fig)
+        self.weekly_overall_chart_fig.subplots_adjust(left=0, right=1, bottom=0, top=1)
         self.weekly_overall_chart_fig.patch.set_facecolor(self.theme.get("frame"))
-        
+
+        # Two persistent ring wedges and a label; updates only move their angles
+        ax_overall = self.weekly_overall_chart_fig.add_subplot(111)
+        ax_overall.set(xlim=(-1, 1), ylim=(-1, 1), aspect='equal')
+        ax_overall.axis('off')
+        ring = dict(width=0.3, edgecolor=self.theme.get("frame"))
+        self._overall_done = Wedge((0, 0), 1, 90, 90, facecolor=self.theme.get("accent"), **ring)
+        self._overall_rest = Wedge((0, 0), 1, 90, 450, facecolor=self.theme.get("border"), **ring)
+        ax_overall.add_patch(self._overall_done)
+        ax_overall.add_patch(self._overall_rest)
+        self._overall_text = ax_overall.text(0, 0, "0%", ha='center', va='center',
+                                             fontproperties=self._fp_large,
+                                             color=self.theme.get("accent"))
+
         self.weekly_overall_chart_image_label = ctk.CTkLabel(stats_container, text="")
         self.weekly_overall_chart_image_label.pack(pady=(10, 5))
 
         # Completed/Total count
         self.weekly_tasks_count_label = ctk.CTkLabel(
             stats_container, text=f"{completed_tasks} / {total_tasks} Bajarildi",
-            font=("Helvetica", 20, "bold"),
+            font=self.FONT_BOLD_20,
             text_color=self.theme.get("text")
         )
         self.weekly_tasks_count_label.pack(pady=10)
@@ -477,7 +743,7 @@ class TrackerApp(ctk.CTk):
         # Store references for updates
         self.weekly_percent_label = ctk.CTkLabel(
             stats_container, text="Haftalik Umumiy Natija",
-            font=("Helvetica", 16),
+            font=self.FONT_16,
             text_color=self.theme.get("accent")
         )
         self.weekly_percent_label.pack(pady=10)
@@ -497,38 +763,62 @@ class TrackerApp(ctk.CTk):
 
         ctk.CTkLabel(
             header_frame, text="🎯 Odatlar Kuzatuvchisi (Haftalik Ko'rsatkichlar)",
-            font=("Helvetica", 16, "bold"),
+            font=self.FONT_BOLD_16,
             text_color=self.theme.get("accent")
         ).pack(side="left")
 
         ctk.CTkButton(
             header_frame, text="🗑️ Barchasini tozalash", width=150, height=32,
-            font=("Helvetica", 13, "bold"),
+            font=self.FONT_BOLD_13,
             fg_color=self.theme.get("error"),
             hover_color="#c0392b",
             command=self.clear_all_habits
         ).pack(side="left", padx=(15, 0))
 
+        # Page navigation
+        ctk.CTkButton(
+            header_frame, text="◀", width=32, height=32,
+            font=self.FONT_BOLD_13,
+            fg_color=self.theme.get("accent"),
+            hover_color=self.theme.get("accent_light"),
+            command=lambda: self.change_habits_page(-1)
+        ).pack(side="left", padx=(15, 0))
+
+        self.habits_page_label = ctk.CTkLabel(
+            header_frame, text="", width=60,
+            font=self.FONT_BOLD_13,
+            text_color=self.theme.get("text")
+        )
+        self.habits_page_label.pack(side="left", padx=5)
+
+        ctk.CTkButton(
+            header_frame, text="▶", width=32, height=32,
+            font=self.FONT_BOLD_13,
+            fg_color=self.theme.get("accent"),
+            hover_color=self.theme.get("accent_light"),
+            command=lambda: self.change_habits_page(1)
+        ).pack(side="left")
+
         # Right-aligned inline input area
         input_container = ctk.CTkFrame(header_frame, fg_color="transparent")
         input_container.pack(side="right")
 
         self.inline_habit_entry = ctk.CTkEntry(
             input_container, placeholder_text="Yangi odat...",
-            font=("Helvetica", 13), height=32, width=350
+            font=self.FONT_13, height=32, width=350
         )
         self.inline_habit_entry.pack(side="left", padx=(0, 8))
 
         ctk.CTkButton(
             input_container, text="➕ Qo'shish", width=100, height=32,
-            font=("Helvetica", 13, "bold"),
+            font=self.FONT_BOLD_13,
             fg_color=self.theme.get("accent"),
             hover_color=self.theme.get("accent_light"),
             command=self.add_habit_inline
         ).pack(side="left")
 
-        # Scrollable habits container
-        self.habits_scroll = ctk.CTkScrollableFrame(frame, fg_color="transparent")
+        # Plain (canvas-free) habits container showing one page of habits at a time
+        self.habits_scroll = ctk.CTkFrame(frame, fg_color="transparent")
         self.habits_scroll.pack(fill="both", expand=True, padx=15, pady=10)
 
         self.populate_habits_list()
@@ -536,103 +826,120 @@ class TrackerApp(ctk.CTk):
     def populate_habits_list(self):
         for widget in self.habits_scroll.winfo_children():
             widget.destroy()
+        self._load_habit_matrix()
 
-        # Header row
-        header = ctk.CTkFrame(self.habits_scroll, fg_color="transparent")
-        header.pack(fill="x", padx=5, pady=(0, 12))
+        # Single grid on the scroll frame: 0-1 actions, 2 name, 3-9 days, 10-11 progress
+        grid = self.habits_scroll
 
+        # Header row
         ctk.CTkLabel(
-            header, text="Odatlar", width=200,
-            font=("Helvetica", 14, "bold"),
+            grid, text="Odatlar", width=200,
+            font=self.FONT_BOLD_14,
             text_color=self.theme.get("accent")
-        ).pack(side="left", padx=5)
+        ).grid(row=0, column=0, columnspan=3, padx=5, pady=(0, 12))
 
         days_uz = ["Du", "Se", "Ch", "Pa", "Ju", "Sh", "Ya"]
-        for day in days_uz:
+        for d_idx, day in enumerate(days_uz):
             ctk.CTkLabel(
-                header, text=day, width=40,
-                font=("Helvetica", 13, "bold"),
+                grid, text=day, width=40,
+                font=self.FONT_BOLD_13,
                 text_color=self.theme.get("accent")
-            ).pack(side="left", padx=10)
+            ).grid(row=0, column=d_idx + 3, pady=(0, 12))
 
         ctk.CTkLabel(
-            header, text="Jarayon", width=300,
-            font=("Helvetica", 14, "bold"),
+            grid, text="Jarayon", width=300,
+            font=self.FONT_BOLD_14,
             text_color=self.theme.get("accent")
-        ).pack(side="left", padx=5)
+        ).grid(row=0, column=10, columnspan=2, padx=5, pady=(0, 12))
 
-        # Habit rows
+        # Habit rows of the current page only
         self.habit_vars = {}
         self.habit_progress_labels = {}
         self.habit_progress_bars = {}
+        self._habit_last_percent = {}
+
+        size = self._habits_page_size
+        page_count = max(1, -(-len(self.habits) // size))
+        self._habits_page = min(self._habits_page, page_count - 1)
+        self.habits_page_label.configure(text=f"{self._habits_page + 1} / {page_count}")
+
+        start = self._habits_page * size
+        for h_idx in range(start, min(start + size, len(self.habits))):
+            self._build_habit_row(h_idx, h_idx - start + 1)
+
+    def change_habits_page(self, step):
+        """Show the previous (-1) or next (+1) page of habits."""
+        page_count = max(1, -(-len(self.habits) // self._habits_page_size))
+        page = min(max(self._habits_page + step, 0), page_count - 1)
+        if page != self._habits_page:
+            # Rebuilding reloads the matrix from daily_data, so keep pending toggles first
+            self._store_matrices()
+            self._habits_page = page
+            self.populate_habits_list()
 
-        for h_idx, habit in enumerate(self.habits):
-            row = ctk.CTkFrame(self.habits_scroll, fg_color=self.theme.get("bg"), corner_radius=8)
-            row.pack(fill="x", padx=5, pady=6)
-
-            actions_frame = ctk.CTkFrame(row, fg_color="transparent")
-            actions_frame.pack(side="left", padx=(8, 0), pady=10)
+    def _build_habit_row(self, h_idx, row):
+        """Place a habit's actions, checkboxes and progress in the given grid row."""
+        habit = self.habits[h_idx]
+        grid = self.habits_scroll
 
-            ctk.CTkButton(
-                actions_frame, text="✎", width=25, height=25,
-                font=("Helvetica", 14), fg_color="transparent",
-                text_color=self.theme.get("accent"), hover_color=self.theme.get("bg"),
-                command=lambda h=habit: self.edit_habit(h)
-            ).pack(side="left", padx=2)
+        ctk.CTkButton(
+            grid, text="✎", width=25, height=25,
+            font=self.FONT_14, fg_color="transparent",
+            text_color=self.theme.get("accent"), hover_color=self.theme.get("bg"),
+            command=lambda h=habit: self.edit_habit(h)
+        ).grid(row=row, column=0, padx=(8, 2))
 
-            ctk.CTkButton(
-                actions_frame, text="🗑️", width=25, height=25,
-                font=("Helvetica", 14), fg_color="transparent",
-                text_color=self.theme.get("error"), hover_color=self.theme.get("bg"),
-                command=lambda h=habit: self.delete_habit(h)
-            ).pack(side="left", padx=2)
-
-            # Habit name
-            display_name = habit if len(habit) <= 18 else habit[:15] + "..."
-            ctk.CTkLabel(
-                row, text=display_name, width=140, anchor="w",
-                font=("Helvetica", 13),
-                text_color=self.theme.get("text")
-            ).pack(side="left", padx=(5, 8), pady=10)
-
-            # Checkboxes for each day
-            row_vars = {}
-            for d_idx in range(7):
-                date = (self.week_start_date + timedelta(days=d_idx)).strftime("%Y-%m-%d")
-                var = ctk.IntVar(value=self.daily_data[date]["habits"].get(habit, False))
-
-                cb = ctk.CTkCheckBox(
-                    row, text="", variable=var, width=25,
-                    fg_color=self.theme.get("accent"),
-                    hover_color=self.theme.get("accent_light"),
-                    checkmark_color=self.theme.get("frame"),
-                    command=lambda h=habit, d=date, v=var: self.update_habit(h, d, v)
-                )
-                cb.pack(side="left", padx=7, pady=10)
-                row_vars[d_idx] = var
-
-            self.habit_vars[h_idx] = row_vars
-
-            # Progress section with larger components
-            progress_frame = ctk.CTkFrame(row, fg_color="transparent", width=220)
-            progress_frame.pack(side="left", padx=8, pady=10)
-
-            prog_bar = ctk.CTkProgressBar(
-                progress_frame, width=200, height=20,
-                fg_color=self.theme.get("border"),
-                progress_color=self.theme.get("accent")
+        ctk.CTkButton(
+            grid, text="🗑️", width=25, height=25,
+            font=self.FONT_14, fg_color="transparent",
+            text_color=self.theme.get("error"), hover_color=self.theme.get("bg"),
+            command=lambda h=habit: self.delete_habit(h)
+        ).grid(row=row, column=1, padx=2)
+
+        # Habit name
+        display_name = habit if len(habit) <= 18 else habit[:15] + "..."
+        ctk.CTkLabel(
+            grid, text=display_name, width=140, anchor="w",
+            font=self.FONT_13,
+            text_color=self.theme.get("text")
+        ).grid(row=row, column=2, padx=(5, 8), sticky="w")
+
+        # Checkboxes for each day
+        row_vars = {}
+        for d_idx, date in enumerate(self._week_dates):
+            var = ctk.IntVar(value=int(self._habit_mat[d_idx, h_idx]))
+
+            cb = ctk.CTkCheckBox(
+                grid, text="", variable=var, width=25,
+                fg_color=self.theme.get("accent"),
+                hover_color=self.theme.get("accent_light"),
+                checkmark_color=self.theme.get("frame"),
+                command=lambda h=habit, d=date, v=var: self.update_habit(h, d, v)
             )
-            prog_bar.pack(side="left", padx=5)
-            prog_bar.set(0)
-            self.habit_progress_bars[h_idx] = prog_bar
+            cb.grid(row=row, column=d_idx + 3, padx=7, pady=10)
+            row_vars[d_idx] = var
 
-            prog_lbl = ctk.CTkLabel(
-                progress_frame, text="0%", width=50,
-                font=("Helvetica", 14, "bold"),
-                text_color=self.theme.get("accent")
-            )
-            prog_lbl.pack(side="left", padx=8)
-            self.habit_progress_labels[h_idx] = prog_lbl
+        self.habit_vars[h_idx] = row_vars
+
+        # Progress section with larger components
+        prog_bar = ctk.CTkProgressBar(
+            grid, width=200, height=20,
+            fg_color=self.theme.get("border"),
+            progress_color=self.theme.get("accent")
+        )
+        prog_bar.grid(row=row, column=10, padx=(13, 5))
+        prog_bar.set(0)
+        self.habit_progress_bars[h_idx] = prog_bar
+
+        prog_lbl = ctk.CTkLabel(
+            grid, text="0%", width=50,
+            font=self.FONT_BOLD_14,
+            text_color=self.theme.get("accent")
+        )
+        prog_lbl.grid(row=row, column=11, padx=8)
+        self.habit_progress_labels[h_idx] = prog_lbl
+
+        self._update_habit_progress(h_idx)
 
     def create_daily_tasks_section(self, parent):
         """Create daily tasks section showing task breakdown for each day."""
@@ -648,13 +955,13 @@ class TrackerApp(ctk.CTk):
 
         ctk.CTkLabel(
             header_frame, text="✅ Kunlik Vazifalar",
-            font=("Helvetica", 16, "bold"),
+            font=self.FONT_BOLD_16,
             text_color=self.theme.get("accent")
         ).pack(side="left")
 
         ctk.CTkButton(
             header_frame, text="🗑️ Barchasini tozalash", width=150, height=32,
-            font=("Helvetica", 13, "bold"),
+            font=self.FONT_BOLD_13,
             fg_color=self.theme.get("error"),
             hover_color="#c0392b",
             command=self.clear_all_tasks
@@ -663,19 +970,25 @@ class TrackerApp(ctk.CTk):
         # Days container
         self.tasks_days_container = ctk.CTkScrollableFrame(frame, fg_color="transparent", orientation="horizontal", height=240)
         self.tasks_days_container.pack(fill="both", expand=True, padx=10, pady=10)
+        self._watch_scroll(self.tasks_days_container, self._materialize_visible_days)
 
         self.populate_tasks_list()
 
     def populate_tasks_list(self):
         for widget in self.tasks_days_container.winfo_children():
             widget.destroy()
+        self._load_task_matrices()
 
         days_uz = ["Dushanba", "Seshanba", "Chorshanba", "Payshanba", "Juma", "Shanba", "Yakshanba"]
 
         self.daily_stats_labels = {}
+        # The counter labels are recreated blank, so forget what the old ones showed
+        for date in self._week_dates:
+            self._last_chart_keys.pop(("label", date), None)
+        self._day_placeholders = []
+        self._day_materialized = [False] * 7
 
-        for d_idx in range(7):
-            date = (self.week_start_date + timedelta(days=d_idx)).strftime("%Y-%m-%d")
+        for d_idx, date in enumerate(self._week_dates):
             day = days_uz[d_idx]
 
             day_frame = ctk.CTkFrame(
@@ -686,6 +999,7 @@ class TrackerApp(ctk.CTk):
             )
             day_frame.pack(side="left", fill="y", expand=False, padx=6, pady=4)
             day_frame.pack_propagate(False)
+            self._day_placeholders.append(day_frame)
 
             # Header with tiny '+' button for Day-Specific task
             header_frame = ctk.CTkFrame(day_frame, fg_color="transparent")
@@ -693,63 +1007,94 @@ class TrackerApp(ctk.CTk):
 
             ctk.CTkLabel(
                 header_frame, text=f"{day}\n{date}",
-                font=("Helvetica", 12, "bold"),
+                font=self.FONT_BOLD_12,
                 text_color=self.theme.get("accent")
             ).pack(side="left", expand=True)
 
             ctk.CTkButton(
                 header_frame, text="+", width=25, height=25,
-                font=("Helvetica", 16, "bold"), fg_color="transparent",
+                font=self.FONT_BOLD_16, fg_color="transparent",
                 text_color=self.theme.get("accent"), hover_color=self.theme.get("border"),
                 command=lambda d=date: self.add_task_to_day(d)
             ).pack(side="right")
 
-            # Tasks
-            tasks_scroll = ctk.CTkScrollableFrame(day_frame, fg_color="transparent", height=150)
-            tasks_scroll.pack(fill="both", expand=True, padx=5, pady=5)
-
-            for task in self.daily_data[date]["tasks"]:
-                task_row = ctk.CTkFrame(tasks_scroll, fg_color="transparent")
-                task_row.pack(anchor="w", padx=4, pady=2, fill="x")
-
-                var = ctk.IntVar(value=self.daily_data[date]["task_status"].get(task, False))
-
-                # Truncate string to avoid pushing buttons out of view
-                display_task = task if len(task) <= 18 else task[:15] + "..."
-
-                cb = ctk.CTkCheckBox(
-                    task_row, text=display_task, variable=var,
-                    font=("Helvetica", 11),
-                    fg_color=self.theme.get("accent"),
-                    hover_color=self.theme.get("accent_light"),
-                    text_color=self.theme.get("text"),
-                    command=lambda t=task, d=date, v=var: self.update_task(t, d, v)
-                )
-                cb.pack(side="left", expand=True, fill="x")
-
-                ctk.CTkButton(
-                    task_row, text="🗑️", width=20, height=20,
-                    font=("Helvetica", 10), fg_color="transparent",
-                    text_color=self.theme.get("error"), hover=False,
-                    command=lambda t=task, d=date: self.delete_task(t, d)
-                ).pack(side="right", padx=1)
-
-                ctk.CTkButton(
-                    task_row, text="✎", width=20, height=20,
-                    font=("Helvetica", 10), fg_color="transparent",
-                    text_color=self.theme.get("accent"), hover=False,
-                    command=lambda t=task, d=date: self.edit_task(t, d)
-                ).pack(side="right", padx=1)
-
             # Stats
             stats_lbl = ctk.CTkLabel(
                 day_frame, text="",
-                font=("Helvetica", 12, "bold"),
+                font=self.FONT_BOLD_12,
                 text_color=self.theme.get("accent")
             )
-            stats_lbl.pack(padx=5, pady=(6, 8))
+            stats_lbl.pack(side="bottom", padx=5, pady=(6, 8))
             self.daily_stats_labels[date] = stats_lbl
 
+        # Task rows are only built once their day scrolls into view
+        self.after_idle(self._materialize_visible_days)
+
+    def _materialize_visible_days(self):
+        """Build the task rows of days that are inside the visible scroll region."""
+        if not self._day_placeholders:
+            return
+        lo, hi = self.tasks_days_container._parent_canvas.xview()
+        for d_idx in range(max(0, int(lo * 7)), min(7, int(hi * 7) + 1)):
+            if not self._day_materialized[d_idx]:
+                self._build_day_tasks(d_idx)
+
+    def _build_day_tasks(self, d_idx):
+        """Fill a day placeholder with its scrollable list of tasks."""
+        self._day_materialized[d_idx] = True
+        date = self._week_dates[d_idx]
+        day_frame = self._day_placeholders[d_idx]
+
+        tasks_scroll = ctk.CTkScrollableFrame(day_frame, fg_color="transparent", height=150)
+        tasks_scroll.pack(fill="both", expand=True, padx=5, pady=5)
+
+        task_status = self._task_mat[d_idx]
+        for t_idx, task in enumerate(self.daily_data[date]["tasks"]):
+            task_row = ctk.CTkFrame(tasks_scroll, fg_color="transparent")
+            task_row.pack(anchor="w", padx=4, pady=2, fill="x")
+
+            var = ctk.IntVar(value=int(task_status[t_idx]))
+
+            # Truncate string to avoid pushing buttons out of view
+            display_task = task if len(task) <= 18 else task[:15] + "..."
+
+            cb = ctk.CTkCheckBox(
+                task_row, text=display_task, variable=var,
+                font=self.FONT_11,
+                fg_color=self.theme.get("accent"),
+                hover_color=self.theme.get("accent_light"),
+                text_color=self.theme.get("text"),
+                command=lambda t=task, d=date, v=var: self.update_task(t, d, v)
+            )
+            cb.pack(side="left", expand=True, fill="x")
+
+            ctk.CTkButton(
+                task_row, text="🗑️", width=20, height=20,
+                font=self.FONT_10, fg_color="transparent",
+                text_color=self.theme.get("error"), hover=False,
+                command=lambda t=task, d=date: self.delete_task(t, d)
+            ).pack(side="right", padx=1)
+
+            ctk.CTkButton(
+                task_row, text="✎", width=20, height=20,
+                font=self.FONT_10, fg_color="transparent",
+                text_color=self.theme.get("accent"), hover=False,
+                command=lambda t=task, d=date: self.edit_task(t, d)
+            ).pack(side="right", padx=1)
+
+    @staticmethod
+    def _watch_scroll(scroll_frame, callback):
+        """Call callback whenever the visible region of a CTkScrollableFrame changes."""
+        canvas = scroll_frame._parent_canvas
+        scrollbar_set = scroll_frame._scrollbar.set
+        option = "xscrollcommand" if scroll_frame._orientation == "horizontal" else "yscrollcommand"
+
+        def on_view_change(first, last):
+            scrollbar_set(first, last)
+            callback()
+
+        canvas.configure(**{option: on_view_change})
+
     def create_add_items_section(self, parent):
         """Create input section for adding new habits and tasks."""
         frame = ctk.CTkFrame(
@@ -761,7 +1106,7 @@ class TrackerApp(ctk.CTk):
 
         ctk.CTkLabel(
             frame, text="➕ Yangi Qo'shish",
-            font=("Helvetica", 18, "bold"),
+            font=self.FONT_BOLD_18,
             text_color=self.theme.get("accent")
         ).pack(anchor="w", padx=15, pady=(15, 10))
 
@@ -770,13 +1115,13 @@ class TrackerApp(ctk.CTk):
 
         self.add_entry = ctk.CTkEntry(
             input_frame, placeholder_text="Odatlar yoki vazifa nomini kiriting...",
-            font=("Helvetica", 13), height=50
+            font=self.FONT_13, height=50
         )
         self.add_entry.pack(side="left", fill="both", expand=True, padx=(0, 8))
 
         ctk.CTkButton(
             input_frame, text="➕ Odatlar", width=150, height=50,
-            font=("Helvetica", 14, "bold"),
+            font=self.FONT_BOLD_14,
             fg_color=self.theme.get("accent"),
             hover_color=self.theme.get("accent_light"),
             command=self.add_habit_global
@@ -784,7 +1129,7 @@ class TrackerApp(ctk.CTk):
 
         ctk.CTkButton(
             input_frame, text="➕ Vazifa", width=150, height=50,
-            font=("Helvetica", 14, "bold"),
+            font=self.FONT_BOLD_14,
             fg_color=self.theme.get("accent"),
             hover_color=self.theme.get("accent_light"),
             command=self.add_task_template
@@ -793,293 +1138,435 @@ class TrackerApp(ctk.CTk):
     def update_habit(self, habit, date, var):
         """Update habit status and refresh charts."""
         status = bool(var.get())
-        self.daily_data[date]["habits"][habit] = status
+        cell = (self._date_index[date], self._habit_index[habit])
+        if bool(self._habit_mat[cell]) == status:
+            return
+        self._habit_mat[cell] = status
+        self._matrices_dirty = True
         logger.info(f"Odat holati o'zgardi (Habit toggled): '{habit}' sanada {date} -> {status}")
-        self.update_all_charts()
+        self._schedule_save()
+        # Habits feed no task chart, so only this habit's progress row needs a refresh
+        self._update_habit_progress(cell[1])
 
     def update_task(self, task, date, var):
         """Update task status and refresh charts."""
         status = bool(var.get())
-        self.daily_data[date]["task_status"][task] = status
+        d_idx = self._date_index[date]
+        t_idx = self._task_index[d_idx][task]
+        if bool(self._task_mat[d_idx][t_idx]) == status:
+            return
+        self._task_mat[d_idx][t_idx] = status
+        self._daily_completed[date] += 1 if status else -1
+        self._matrices_dirty = True
         logger.info(f"Vazifa holati o'zgardi (Task toggled): '{task}' sanada {date} -> {status}")
-        self.update_all_charts()
+        self._schedule_save()
+        # Only this day's donut changed; the weekly charts follow through the idle queue
+        if self._charts_visible():
+            self._update_day_donut(d_idx, self._daily_completed[date], self._daily_total[date])
+        self._queue_chart_updates(WEEK_CHARTS)
 
-    def update_all_charts(self):
-        """Update all visualizations with current data."""
-        try:
-            # Update daily donut charts
-            for date, (fig, ax) in self.week_charts.items():
-                if date not in self.daily_data:
-                    continue
-                tasks = self.daily_data[date]["tasks"]
-                completed = sum(1 for t in tasks if self.daily_data[date]["task_status"].get(t, False))
-                total = len(tasks) if tasks else 1
-                percent = int((completed / total) * 100)
-
-                ax.clear()
-                colors = [self.theme.get("accent"), self.theme.get("border")]
-                wedges, texts = ax.pie([completed, total - completed], colors=colors, 
-                                       startangle=90, wedgeprops=dict(width=0.35, 
-                                       edgecolor=self.theme.get("bg")))
-                ax.text(0, 0, f"{percent}%", ha='center', va='center',
-                        fontsize=11, fontweight='bold', color=self.theme.get("accent"))
-
-                if date in self.week_image_labels:
-                    buf = io.BytesIO()
-                    fig.savefig(buf, format="png", bbox_inches="tight", pad_inches=0.1, facecolor=fig.get_facecolor())
-                    buf.seek(0)
-                    img = Image.open(buf)
-                    ctk_img = ctk.CTkImage(light_image=img, dark_image=img, size=(170, 170))
-                    self.week_image_labels[date].configure(image=ctk_img)
-                    self.week_image_labels[date].image = ctk_img  # Prevent Garbage Collection
-
-            # Update daily stats labels
-            for date, lbl in self.daily_stats_labels.items():
-                if date not in self.daily_data:
-                    continue
-                tasks = self.daily_data[date]["tasks"]
-                completed = sum(1 for t in tasks if self.daily_data[date]["task_status"].get(t, False))
-                total = len(tasks) if tasks else 0
-                lbl.configure(text=f"✓ {completed}/{total}")
-
-            # Update habit progress bars and labels
-            for h_idx, habit in enumerate(self.habits):
-                if h_idx not in self.habit_vars:
-                    continue
-                completed = sum(1 for d_idx in range(7) if d_idx in self.habit_vars[h_idx] and self.habit_vars[h_idx][d_idx].get())
-                percent = int((completed / 7) * 100)
+    @staticmethod
+    def _figure_to_image(fig):
+        """Rasterize a figure on its Agg canvas and wrap the RGBA buffer as a PIL image."""
+        canvas = fig._agg_canvas
+        canvas.draw()
+        return TrackerApp._canvas_to_image(canvas)
 
-                if h_idx in self.habit_progress_bars:
-                    self.habit_progress_bars[h_idx].set(percent / 100)
+    @staticmethod
+    def _canvas_to_image(canvas):
+        """Wrap the current RGBA buffer of an Agg canvas as a PIL image (no redraw)."""
+        buf = canvas.buffer_rgba()
+        return Image.frombuffer('RGBA', canvas.get_width_height(), buf, 'raw', 'RGBA', 0, 1)
+
+    def _get_cached_chart(self, key):
+        """Return a cached chart image for the given key, or None."""
+        img = self._chart_cache.get(key)
+        if img is not None:
+            self._chart_cache.move_to_end(key)
+        return img
+
+    def _cache_chart(self, key, img):
+        """Store a rendered chart image, evicting the least recently used ones."""
+        self._chart_cache[key] = img
+        self._chart_cache.move_to_end(key)
+        while len(self._chart_cache) > CHART_CACHE_SIZE:
+            self._chart_cache.popitem(last=False)
 
-                if h_idx in self.habit_progress_labels:
-                    self.habit_progress_labels[h_idx].configure(text=f"{percent}%")
+    @staticmethod
+    def _show_chart_image(label, img, size):
+        """Show a PIL image on a label, reusing the label's CTkImage after the first call."""
+        ctk_img = getattr(label, "image", None)
+        if ctk_img is None:
+            ctk_img = ctk.CTkImage(light_image=img, dark_image=img, size=size)
+            label.configure(image=ctk_img)
+            label.image = ctk_img  # Prevent Garbage Collection
+        else:
+            ctk_img.configure(light_image=img, dark_image=img)
+
+    def _compute_week_stats(self):
+        """Collect per-day and weekly task completion figures in a single pass."""
+        per_day_done = np.array([self._daily_completed[d] for d in self._week_dates], dtype=np.int64)
+        per_day_totals = np.array([self._daily_total[d] for d in self._week_dates], dtype=np.int64)
+
+        weekly_done = int(per_day_done.sum())
+        weekly_total = int(per_day_totals.sum())
+        return {
+            "per_day": per_day_done * 100 // np.maximum(per_day_totals, 1),
+            "per_day_done": per_day_done,
+            "per_day_totals": per_day_totals,
+            "weekly_pct": weekly_done * 100 // weekly_total if weekly_total > 0 else 0,
+            "weekly_done": weekly_done,
+            "weekly_total": weekly_total,
+        }
 
-            # Update overall growth bar chart
-            self.update_bar_chart()
+    def _queue_chart_updates(self, items=CHART_QUEUE_ITEMS):
+        """Render the given charts one per idle callback so the window stays responsive."""
+        if not self._charts_visible():
+            self._chart_dirty = True
+            return
+        was_idle = not self._chart_queue
+        if any(item != "habits" for item in items):
+            self._last_stats = self._compute_week_stats()
+        for item in items:
+            if item not in self._chart_queue:
+                self._chart_queue.append(item)
+        if was_idle:
+            self.after_idle(self._drain_chart_queue)
+
+    def _drain_chart_queue(self):
+        """Render the next queued chart, then yield back to the event loop."""
+        if not self._chart_queue:
+            return
+        item = self._chart_queue.popleft()
+        stats = self._last_stats
+        try:
+            if item == "bar":
+                self.update_bar_chart(stats)
+            elif item == "weekly_overall":
+                self.update_weekly_overall(stats)
+            elif item == "donuts":
+                self.update_day_donuts(stats)
+            elif item == "habits":
+                self._refresh_habit_progress()
         except Exception as e:
-            logger.error(f"Error updating charts: {e}")
+            logger.error(f"Error rendering queued chart '{item}': {e}")
+        if self._chart_queue:
+            self.after_idle(self._drain_chart_queue)
+        else:
+            self._charts_rendered = True
+
+    def update_day_donuts(self, stats):
+        """Update the daily donut charts and the per-day task counters."""
+        try:
+            for d_idx in range(len(self._week_dates)):
+                self._update_day_donut(d_idx, int(stats["per_day_done"][d_idx]),
+                                       int(stats["per_day_totals"][d_idx]))
+        except Exception as e:
+            logger.error(f"Error updating daily donuts: {e}")
+
+    def _update_day_donut(self, d_idx, completed, total):
+        """Update one day's donut and task counter label if its figures changed."""
+        date = self._week_dates[d_idx]
+        if date in self.week_canvases:
+            key = (completed, total, self.theme.current_theme)
+            if self._last_chart_keys.get(date) != key:
+                self._last_chart_keys[date] = key
+                canvas, arc_done, arc_rest, text_id = self.week_canvases[date]
+
+                # Clockwise from 12 o'clock; zero-length arcs are hidden so Tk draws nothing
+                extent = 360 * completed / total if total else 0
+                canvas.itemconfigure(arc_done, extent=-extent,
+                                     state="normal" if extent > 0 else "hidden")
+                canvas.itemconfigure(arc_rest, start=90 - extent, extent=extent - 360,
+                                     state="normal" if extent < 360 else "hidden")
+                canvas.itemconfigure(text_id, text=f"{completed * 100 // max(total, 1)}%")
+
+        if date in self.daily_stats_labels:
+            key = (completed, total)
+            if self._last_chart_keys.get(("label", date)) != key:
+                self._last_chart_keys[("label", date)] = key
+                self.daily_stats_labels[date].configure(text=f"✓ {completed}/{total}")
+
+    def _refresh_habit_progress(self):
+        """Update all habit progress bars and labels from one matrix reduction."""
+        pcts = self._habit_mat.sum(axis=0) * 100 // 7
+        for h_idx in self.habit_progress_bars:
+            self._update_habit_progress(h_idx, int(pcts[h_idx]))
+
+    def _update_habit_progress(self, h_idx, percent=None):
+        """Refresh the progress bar and label of a single (built) habit row."""
+        if percent is None:
+            percent = int(self._habit_mat[:, h_idx].sum()) * 100 // 7
+
+        # Only touch Tk when the shown value actually changes
+        if self._habit_last_percent.get(h_idx) == percent:
+            return
+        self._habit_last_percent[h_idx] = percent
+
+        if h_idx in self.habit_progress_bars:
+            self.habit_progress_bars[h_idx].set(percent / 100)
 
-    def update_bar_chart(self):
+        if h_idx in self.habit_progress_labels:
+            self.habit_progress_labels[h_idx].configure(text=f"{percent}%")
+
+    def update_bar_chart(self, stats=None):
         """Update the overall growth bar chart with current data."""
         try:
             if self.bar_chart_fig is None or self.bar_chart_image_label is None:
                 return
 
-            days = ['Du', 'Se', 'Ch', 'Pa', 'Ju', 'Sh', 'Ya']
-            completed_counts = []
-
-            for i in range(7):
-                date = (self.week_start_date + timedelta(days=i)).strftime("%Y-%m-%d")
-                if date in self.daily_data:
-                    tasks = self.daily_data[date]["tasks"]
-                    completed = sum(1 for t in tasks if self.daily_data[date]["task_status"].get(t, False))
-                    total = len(tasks) if tasks else 1
-                    percent = int((completed / total) * 100)
-                else:
-                    percent = 0
-                completed_counts.append(percent)
+            if stats is None:
+                stats = self._compute_week_stats()
+            completed_counts = stats["per_day"].tolist()
 
-            ax = self.bar_chart_fig.axes[0]
-            ax.clear()
-
-            bars = ax.bar(days, completed_counts, color=self.theme.get("accent"), 
-                         alpha=0.85, edgecolor=self.theme.get("accent_light"), linewidth=2)
-
-            ax.set_ylim(0, 110)
-            ax.set_ylabel("Foiz (%)", fontsize=12, fontweight='bold')
-            ax.set_xlabel("Hafta kunlari", fontsize=12, fontweight='bold')
-            ax.spines['top'].set_visible(False)
-            ax.spines['right'].set_visible(False)
-            ax.spines['left'].set_color(self.theme.get("border"))
-            ax.spines['bottom'].set_color(self.theme.get("border"))
-            ax.grid(axis='y', alpha=0.3, linestyle='--')
-
-            # Add value labels on bars
-            for bar in bars:
-                height = bar.get_height()
-                ax.text(bar.get_x() + bar.get_width()/2., height + 2,
-                        f'{int(height)}%', ha='center', va='bottom',
-                        fontsize=11, fontweight='bold', color=self.theme.get("accent"))
-
-            ax.set_facecolor(self.theme.get("frame"))
-            
-            buf = io.BytesIO()
-            self.bar_chart_fig.savefig(buf, format="png", bbox_inches="tight", facecolor=self.bar_chart_fig.get_facecolor())
-            buf.seek(0)
-            img = Image.open(buf)
-            ctk_img = ctk.CTkImage(light_image=img, dark_image=img, size=(600, 250))
-            self.bar_chart_image_label.configure(image=ctk_img)
-            self.bar_chart_image_label.image = ctk_img  # Prevent Garbage Collection
-            
-            # Update weekly stats if they exist
-            if hasattr(self, 'weekly_percent_label'):
-                total_tasks = 0
-                completed_tasks = 0
-                for i in range(7):
-                    date = (self.week_start_date + timedelta(days=i)).strftime("%Y-%m-%d")
-                    if date in self.daily_data:
-                        tasks = self.daily_data[date]["tasks"]
-                        total_tasks += len(tasks)
-                        completed_tasks += sum(1 for t in tasks if self.daily_data[date]["task_status"].get(t, False))
-                
-                weekly_percent = int((completed_tasks / total_tasks * 100)) if total_tasks > 0 else 0
-                
-                # Update the large generic label if it still exists (fallback), otherwise draw donut
-                if hasattr(self, 'weekly_percent_large_label'):
-                    self.weekly_percent_large_label.configure(text=f"{weekly_percent}%")
-                    
-                if getattr(self, 'weekly_overall_chart_fig', None) and getattr(self, 'weekly_overall_chart_image_label', None):
-                    ax_overall = self.weekly_overall_chart_fig.add_subplot(111) if not self.weekly_overall_chart_fig.axes else self.weekly_overall_chart_fig.axes[0]
-                    ax_overall.clear()
-                    
-                    colors = [self.theme.get("accent"), self.theme.get("border")]
-                    comp_val = completed_tasks
-                    rem_val = total_tasks - completed_tasks
-                    if total_tasks == 0:
-                        comp_val, rem_val = 0, 1
-                        
-                    ax_overall.pie([comp_val, rem_val], colors=colors, startangle=90, 
-                                   wedgeprops=dict(width=0.3, edgecolor=self.theme.get("frame")))
-                    ax_overall.text(0, 0, f"{weekly_percent}%", ha='center', va='center',
-                                    fontsize=20, fontweight='bold', color=self.theme.get("accent"))
-                    
-                    buf2 = io.BytesIO()
-                    self.weekly_overall_chart_fig.savefig(buf2, format="png", bbox_inches="tight", pad_inches=0, facecolor=self.theme.get("frame"))
-                    buf2.seek(0)
-                    img2 = Image.open(buf2)
-                    ctk_img2 = ctk.CTkImage(light_image=img2, dark_image=img2, size=(160, 160))
-                    self.weekly_overall_chart_image_label.configure(image=ctk_img2)
-                    self.weekly_overall_chart_image_label.image = ctk_img2
-                    
-                if hasattr(self, 'weekly_tasks_count_label'):
-                    self.weekly_tasks_count_label.configure(text=f"{completed_tasks} / {total_tasks} Bajarildi")
-                
-                # The labels will be updated through the refresh, but we store the data
-                self.weekly_stats_containers = {"completed": completed_tasks, "total": total_tasks, "percent": weekly_percent}
+            bar_key = ("bar",) + tuple(completed_counts) + (self.theme.current_theme,)
+            if self._last_chart_keys.get("bar") == bar_key:
+                return
+            self._last_chart_keys["bar"] = bar_key
+            img = self._get_cached_chart(bar_key)
+            if img is None:
+                # Mutate the existing artists instead of re-plotting the axes
+                for rect, text, pct in zip(self.bar_rects, self.bar_texts, completed_counts):
+                    rect.set_height(pct)
+                    text.set_y(pct + 2)
+                    text.set_text(f'{pct}%')
+
+                # Blit: restore the static axes background, then draw only bars and labels
+                canvas = self.bar_chart_fig._agg_canvas
+                ax = self.bar_chart_fig.axes[0]
+                if self._bar_bg is None:
+                    canvas.draw()
+                    self._bar_bg = canvas.copy_from_bbox(ax.bbox)
+                canvas.restore_region(self._bar_bg)
+                for rect in self.bar_rects:
+                    ax.draw_artist(rect)
+                for text in self.bar_texts:
+                    ax.draw_artist(text)
+                canvas.blit(ax.bbox)
+
+                img = self._canvas_to_image(canvas).copy()
+                self._cache_chart(bar_key, img)
+            self._show_chart_image(self.bar_chart_image_label, img, (600, 250))
         except Exception as e:
             logger.error(f"Error updating bar chart: {e}")
 
+    def update_weekly_overall(self, stats):
+        """Update the weekly overall donut and task counters."""
+        try:
+            if self.weekly_percent_label is None:
+                return
+
+            total_tasks = stats["weekly_total"]
+            completed_tasks = stats["weekly_done"]
+            weekly_percent = stats["weekly_pct"]
+
+            overall_key = (weekly_percent, completed_tasks, total_tasks, self.theme.current_theme)
+            if self._last_chart_keys.get("weekly_overall") == overall_key:
+                return
+            self._last_chart_keys["weekly_overall"] = overall_key
+
+            # Update the large generic label if it still exists (fallback), otherwise draw donut
+            if hasattr(self, 'weekly_percent_large_label'):
+                self.weekly_percent_large_label.configure(text=f"{weekly_percent}%")
+
+            if getattr(self, 'weekly_overall_chart_fig', None) and getattr(self, 'weekly_overall_chart_image_label', None):
+                # The image depends only on the whole percent, so at most 101 per theme
+                donut_key = ("weekly_overall", self.theme.current_theme, weekly_percent)
+                img2 = self._get_cached_chart(donut_key)
+                if img2 is None:
+                    # Clockwise from 12 o'clock, like the pie it replaces
+                    angle = 3.6 * weekly_percent
+                    self._overall_done.set_theta1(90 - angle)
+                    self._overall_done.set_theta2(90)
+                    self._overall_done.set_visible(angle > 0)
+                    self._overall_rest.set_theta1(90)
+                    self._overall_rest.set_theta2(450 - angle)
+                    self._overall_rest.set_visible(angle < 360)
+                    self._overall_text.set_text(f"{weekly_percent}%")
+
+                    img2 = self._figure_to_image(self.weekly_overall_chart_fig).copy()
+                    self._cache_chart(donut_key, img2)
+                self._show_chart_image(self.weekly_overall_chart_image_label, img2, (160, 160))
+
+            if hasattr(self, 'weekly_tasks_count_label'):
+                self.weekly_tasks_count_label.configure(text=f"{completed_tasks} / {total_tasks} Bajarildi")
+
+            # The labels will be updated through the refresh, but we store the data
+            self.weekly_stats_containers = {"completed": completed_tasks, "total": total_tasks, "percent": weekly_percent}
+        except Exception as e:
+            logger.error(f"Error updating weekly stats: {e}")
+
     def add_habit_global(self):
         """Add a new habit to the tracker."""
+        self._store_matrices()
         text = self.add_entry.get().strip()
         if not text:
             logger.warning("Empty habit name provided")
             return
         
-        if text in self.habits:
+        if text in self._habit_index:
             logger.info(f"Habit '{text}' already exists")
             return
         
         self.habits.append(text)
+        self._habits_page = (len(self.habits) - 1) // self._habits_page_size
         for date in self.daily_data:
             self.daily_data[date]["habits"][text] = False
         
         self.add_entry.delete(0, "end")
         logger.info(f"Added new habit: {text}")
         self.populate_habits_list()
-        self.update_all_charts()
+        self._schedule_save()
+        self._queue_chart_updates(HABIT_CHARTS)
 
     def add_habit_inline(self):
         """Add a new habit directly from the inline entry."""
+        self._store_matrices()
         new_habit = self.inline_habit_entry.get().strip()
         if new_habit:
-            if new_habit in self.habits:
+            if new_habit in self._habit_index:
                 logger.info(f"Habit '{new_habit}' already exists")
                 return
             
             self.habits.append(new_habit)
+            self._habits_page = (len(self.habits) - 1) // self._habits_page_size
             for date in self.daily_data:
                 self.daily_data[date]["habits"][new_habit] = False
             
             logger.info(f"Added new inline habit: {new_habit}")
             self.inline_habit_entry.delete(0, "end")
             self.populate_habits_list()
-            self.update_all_charts()
+            self._schedule_save()
+            self._queue_chart_updates(HABIT_CHARTS)
 
     def add_task_template(self):
         """Add a new task template to all days."""
+        self._store_matrices()
         text = self.add_entry.get().strip()
         if not text:
             logger.warning("Empty task name provided")
             return
         
-        if text in self.task_templates:
+        if text in self._task_templates_set:
             logger.info(f"Task template '{text}' already exists")
             return
         
         self.task_templates.append(text)
+        self._task_templates_set.add(text)
         for date in self.daily_data:
             self.daily_data[date]["tasks"].append(text)
             self.daily_data[date]["task_status"][text] = False
+        self._total_task_count += len(self.daily_data)
         
         self.add_entry.delete(0, "end")
         logger.info(f"Added new task template: {text}")
         self.populate_tasks_list()
-        self.update_all_charts()
+        self._schedule_save()
+        self._queue_chart_updates(TASK_CHARTS)
 
     def add_task_to_day(self, date):
         """Add a specific task only to the selected day's dictionary."""
+        self._store_matrices()
         dialog = ctk.CTkInputDialog(text=f"{date} uchun yangi vazifa:", title="Kunga Vazifa Qo'shish")
         new_task = dialog.get_input()
         if new_task and new_task.strip():
             new_task = new_task.strip()
             
-            if new_task in self.daily_data[date]["tasks"]:
+            if new_task in self._task_index[self._date_index[date]]:
                 return # Already exists in this day
                 
             self.daily_data[date]["tasks"].append(new_task)
             self.daily_data[date]["task_status"][new_task] = False
+            self._total_task_count += 1
                 
             logger.info(f"Added custom daily task: {new_task} on {date}")
             self.populate_tasks_list()
-            self.update_all_charts()
+            self._schedule_save()
+            self._queue_chart_updates(TASK_CHARTS)
 
     def toggle_theme_action(self):
         """Toggle between light and dark theme."""
+        previous = self.theme.palette()
         self.theme.toggle()
-        self.refresh_ui()
+        self._chart_cache.clear()
+        self.refresh_ui(previous)
 
-    def refresh_ui(self):
-        """Refresh entire UI to reflect changes."""
-        # Set focus to the main window to prevent active widgets from throwing focus errors when deleted
+    def refresh_ui(self, previous):
+        """Recolor the existing widgets and charts from the previous theme palette."""
+        # Set focus to the main window so no entry is mid-edit while it is reconfigured
         self.focus_set()
-        
-        # Clear all widgets
-        for widget in self.winfo_children():
-            widget.destroy()
-            
-        # Set appearance mode after widgets are destroyed to prevent update loop bugs
+
+        # Map every old theme color to its replacement; colors shared by both themes stay put
+        current = self.theme.palette()
+        remap = {previous[key]: current[key] for key in current if previous[key] != current[key]}
+
+        # Collect first: a new color can equal another key's old one (light border == dark text)
+        targets = list(self._themed_widgets(remap))
+        for widget, option, color in targets:
+            widget.configure(**{option: remap[color]})
+        count = len(targets)
+
+        # Switch mode last: scrollable frames recolor their raw canvas from the remapped parents
         mode = "dark" if self.theme.is_dark() else "light"
         ctk.set_appearance_mode(mode)
-        
-        # Reset UI element references
-        self.week_charts = {}
-        self.week_image_labels = {}
-        self.daily_stats_labels = {}
-        self.habit_vars = {}
-        self.habit_progress_labels = {}
-        self.habit_progress_bars = {}
-        
-        # Rebuild UI
-        self.setup_ui()
-        logger.info("UI refreshed successfully (charts rendering deferred)")
-        self.after(100, self.update_all_charts)
+
+        self._recolor_charts()
+        self._last_chart_keys = {}
+        logger.info(f"UI recolored in place ({count} widget options, charts rendering deferred)")
+        self._queue_chart_updates()
+
+    def _themed_widgets(self, remap):
+        """Yield (widget, option, color) for every widget option holding a remapped color."""
+        stack = list(self.winfo_children())
+        while stack:
+            widget = stack.pop()
+            stack.extend(widget.winfo_children())
+            if not isinstance(widget, ctk.CTkBaseClass):
+                continue
+            for option in THEMED_OPTIONS:
+                try:
+                    color = widget.cget(option)
+                except ValueError:
+                    continue
+                if isinstance(color, str) and color in remap:
+                    yield widget, option, color
+
+    def _recolor_charts(self):
+        """Apply the current theme colors to the canvas donuts and matplotlib figures."""
+        bg, frame, border = self.theme.get("bg"), self.theme.get("frame"), self.theme.get("border")
+
+        for canvas, arc_done, arc_rest, text_id in self.week_canvases.values():
+            canvas.configure(bg=bg)
+            canvas.itemconfigure(arc_rest, outline=border)
+
+        if self.bar_chart_fig is not None:
+            self.bar_chart_fig.patch.set_facecolor(frame)
+            ax = self.bar_chart_fig.axes[0]
+            ax.set_facecolor(frame)
+            ax.spines['left'].set_color(border)
+            ax.spines['bottom'].set_color(border)
+            # The blit background carries the old colors
+            self._bar_bg = None
+
+        if getattr(self, 'weekly_overall_chart_fig', None):
+            self.weekly_overall_chart_fig.patch.set_facecolor(frame)
+            self._overall_done.set_edgecolor(frame)
+            self._overall_rest.set_edgecolor(frame)
+            self._overall_rest.set_facecolor(border)
 
     def edit_habit(self, old_habit):
+        self._store_matrices()
         try:
             dialog = ctk.CTkInputDialog(text=f"'{old_habit}' nomini o'zgartirish:", title="Tahrirlash")
             new_habit = dialog.get_input()
             if new_habit and new_habit.strip() and new_habit != old_habit:
                 new_habit = new_habit.strip()
-                if new_habit in self.habits:
+                if new_habit in self._habit_index:
                     logger.warning(f"Odatni o'zgartirish xatosi: '{new_habit}' nomli odat ro'yxatda allaqachon mavjud.")
-                    import tkinter.messagebox as messagebox
                     messagebox.showwarning("Ogohlantirish", "Bunday odat allaqachon mavjud!")
                     return # Already exists
                 
-                idx = self.habits.index(old_habit)
-                self.habits[idx] = new_habit
+                self.habits[self._habit_index[old_habit]] = new_habit
                 
                 for date in self.daily_data:
                     val = self.daily_data[date]["habits"].pop(old_habit, False)
@@ -1087,64 +1574,70 @@ class TrackerApp(ctk.CTk):
                     
                 logger.info(f"Odat qayta nomlandi (Habit renamed): '{old_habit}' -> '{new_habit}'")
                 self.populate_habits_list()
-                self.update_all_charts()
+                self._schedule_save()
+                self._queue_chart_updates(HABIT_CHARTS)
         except Exception as e:
             logger.error(f"Error editing habit '{old_habit}': {e}")
 
     def delete_habit(self, habit):
-        if habit in self.habits:
-            from tkinter import messagebox
+        self._store_matrices()
+        if habit in self._habit_index:
             confirm = messagebox.askyesno("Tasdiqlash", f"'{habit}' odatini barcha kunlardan o'chirmoqchimisiz?")
             if confirm:
-                self.habits.remove(habit)
+                del self.habits[self._habit_index[habit]]
                 for date in self.daily_data:
                     self.daily_data[date]["habits"].pop(habit, None)
                 logger.info(f"Odat o'chirildi (Habit deleted): '{habit}'")
                 self.populate_habits_list()
-                self.update_all_charts()
+                self._schedule_save()
+                self._queue_chart_updates(HABIT_CHARTS)
 
     def edit_task(self, old_task, date):
+        self._store_matrices()
         try:
             dialog = ctk.CTkInputDialog(text=f"'{old_task}' nomini o'zgartirish ({date}):", title="Tahrirlash")
             new_task = dialog.get_input()
             if new_task and new_task.strip() and new_task != old_task:
                 new_task = new_task.strip()
                 
-                if new_task in self.daily_data[date]["tasks"]:
+                day_tasks = self._task_index[self._date_index[date]]
+                if new_task in day_tasks:
                     logger.warning(f"Vazifani o'zgartirish xatosi: '{new_task}' nomli vazifa ({date}) ro'yxatida allaqachon mavjud.")
-                    import tkinter.messagebox as messagebox
                     messagebox.showwarning("Ogohlantirish", "Bunday vazifa allaqachon mavjud!")
                     return
                     
-                t_idx = self.daily_data[date]["tasks"].index(old_task)
-                self.daily_data[date]["tasks"][t_idx] = new_task
+                self.daily_data[date]["tasks"][day_tasks[old_task]] = new_task
                 val = self.daily_data[date]["task_status"].pop(old_task, False)
                 self.daily_data[date]["task_status"][new_task] = val
                     
                 logger.info(f"Vazifa qayta nomlandi (Task renamed): '{old_task}' -> '{new_task}' (sana: {date})")
                 self.populate_tasks_list()
-                self.update_all_charts()
+                self._schedule_save()
+                self._queue_chart_updates(TASK_CHARTS)
         except Exception as e:
              logger.error(f"Error editing task '{old_task}' on {date}: {e}")
 
     def delete_task(self, task, date):
+        self._store_matrices()
         try:
-            from tkinter import messagebox
             confirm = messagebox.askyesno("Tasdiqlash", f"'{task}' vazifasini ({date}) dan o'chirmoqchimisiz?")
             if confirm:
-                if task in self.daily_data[date]["tasks"]:
-                    self.daily_data[date]["tasks"].remove(task)
+                t_idx = self._task_index[self._date_index[date]].get(task)
+                if t_idx is not None:
+                    del self.daily_data[date]["tasks"][t_idx]
+                    self._total_task_count -= 1
                     self.daily_data[date]["task_status"].pop(task, None)
                     logger.info(f"Vazifa o'chirildi (Task deleted): '{task}' (sana: {date})")
                     
                 self.populate_tasks_list()
-                self.update_all_charts()
+                self._schedule_save()
+                self._queue_chart_updates(TASK_CHARTS)
         except Exception as e:
             logger.error(f"Error deleting task '{task}' on {date}: {e}")
 
     def clear_all_habits(self):
         """Clear all habits after confirmation."""
-        from tkinter import messagebox
+        self._store_matrices()
         if not self.habits:
             messagebox.showinfo("Ma'lumot", "Odatlar ro'yxati bo'sh.")
             return
@@ -1155,20 +1648,15 @@ class TrackerApp(ctk.CTk):
             for date in self.daily_data:
                 self.daily_data[date]["habits"].clear()
             self.populate_habits_list()
-            self.update_all_charts()
+            self._schedule_save()
+            self._queue_chart_updates(HABIT_CHARTS)
             logger.info("All habits cleared.")
 
     def clear_all_tasks(self):
         """Clear all tasks (and task templates) after confirmation."""
-        from tkinter import messagebox
+        self._store_matrices()
         
-        has_tasks = len(self.task_templates) > 0
-        if not has_tasks:
-            for date in self.daily_data:
-                if self.daily_data[date]["tasks"]:
-                    has_tasks = True
-                    break
-                    
+        has_tasks = self._total_task_count > 0 or bool(self.task_templates)
         if not has_tasks:
             messagebox.showinfo("Ma'lumot", "Vazifalar ro'yxati bo'sh.")
             return
@@ -1176,44 +1664,50 @@ class TrackerApp(ctk.CTk):
         confirm = messagebox.askyesno("Tasdiqlash", "Haqiqatan ham barcha vazifalarni o'chirmoqchimisiz? Bu amalni ortga qaytarib bo'lmaydi.")
         if confirm:
             self.task_templates.clear()
+            self._task_templates_set.clear()
+            self._total_task_count = 0
             for date in self.daily_data:
                 self.daily_data[date]["tasks"].clear()
                 self.daily_data[date]["task_status"].clear()
             self.populate_tasks_list()
-            self.update_all_charts()
+            self._schedule_save()
+            self._queue_chart_updates(TASK_CHARTS)
             logger.info("All tasks cleared.")
 
+    def _pandas(self):
+        """Import pandas on first use (it is slow to load) and keep the module for later exports."""
+        if self._pd is None:
+            import pandas as pd
+            self._pd = pd
+        return self._pd
+
     def export_to_excel(self):
         """Export current weekly data to an Excel file using Pandas."""
+        self._store_matrices()
         try:
-            import pandas as pd
-            from tkinter import filedialog
-            from tkinter import messagebox
-            import os
+            pd = self._pandas()
             
             # Prompt for save file
             file_path = filedialog.asksaveasfilename(
                 defaultextension=".xlsx",
                 filetypes=[("Excel files", "*.xlsx")],
                 title="Excel faylini saqlash",
-                initialfile=f"Odatlar_{self.week_start_date.strftime('%Y-%m-%d')}.xlsx"
+                initialfile=f"Odatlar_{self._week_dates[0]}.xlsx"
             )
             
             if not file_path:
                 return
                 
             days_uz = ["Dushanba", "Seshanba", "Chorshanba", "Payshanba", "Juma", "Shanba", "Yakshanba"]
-            dates = [(self.week_start_date + timedelta(days=i)).strftime("%Y-%m-%d") for i in range(7)]
+            dates = self._week_dates
+            col_names = [f"{days_uz[i]} ({date})" for i, date in enumerate(dates)]
             
-            # 1. Habits DF
-            habit_data = {"Odatlar": self.habits}
-            for i, date in enumerate(dates):
-                col_name = f"{days_uz[i]} ({date})"
-                habit_data[col_name] = [
-                    f"Bajarildi: {h}" if self.daily_data[date]["habits"].get(h, False) else f"Bajarilmadi: {h}"
-                    for h in self.habits
-                ]
-            df_habits = pd.DataFrame(habit_data)
+            # 1. Habits DF: cells are picked from the (day, habit) matrix in one np.where
+            habit_names = np.array(self.habits, dtype=object)[:, None]
+            habit_cells = np.where(self._habit_mat.T.astype(bool),
+                                   "Bajarildi: " + habit_names, "Bajarilmadi: " + habit_names)
+            df_habits = pd.DataFrame(habit_cells, columns=col_names)
+            df_habits.insert(0, "Odatlar", self.habits)
             
             # 2. Tasks DF
             all_tasks = set(self.task_templates)
@@ -1222,47 +1716,59 @@ class TrackerApp(ctk.CTk):
                     all_tasks.update(self.daily_data[date]["tasks"])
             
             all_tasks_list = list(all_tasks)
-            task_data = {"Vazifalar": all_tasks_list}
-            for i, date in enumerate(dates):
-                col_name = f"{days_uz[i]} ({date})"
-                task_data[col_name] = [
-                    f"Bajarildi: {t}" if self.daily_data[date]["task_status"].get(t, False) else ("-" if t not in self.daily_data[date]["tasks"] else f"Bajarilmadi: {t}")
-                    for t in all_tasks_list
-                ]
-            df_tasks = pd.DataFrame(task_data)
+            # Resolve the per-day lookups once, outside the per-task comprehensions
+            day_indexes = [self._task_index[d_idx] for d_idx in range(len(dates))]
+            day_statuses = [self.daily_data[date]["task_status"] for date in dates]
+            present = np.array([[t in index for t in all_tasks_list] for index in day_indexes],
+                               dtype=bool).T
+            done = np.array([[status.get(t, False) for t in all_tasks_list] for status in day_statuses],
+                            dtype=bool).T
+            task_names = np.array(all_tasks_list, dtype=object)[:, None]
+            task_cells = np.where(done, "Bajarildi: " + task_names,
+                                  np.where(present, "Bajarilmadi: " + task_names, "-"))
+            df_tasks = pd.DataFrame(task_cells, columns=col_names)
+            df_tasks.insert(0, "Vazifalar", all_tasks_list)
             
-            # Write to Excel with auto-adjusted columns
-            with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-                df_habits.to_excel(writer, sheet_name='Odatlar', index=False)
-                df_tasks.to_excel(writer, sheet_name='Vazifalar', index=False)
-                
-                # Auto-adjust column widths
-                from openpyxl.utils import get_column_letter
-                for worksheet_name in writer.sheets:
-                    worksheet = writer.sheets[worksheet_name]
-                    for col in worksheet.columns:
-                        max_length = 0
-                        column = col[0].column_letter # Get the column name
-                        for cell in col:
-                            try:
-                                if len(str(cell.value)) > max_length:
-                                    max_length = len(cell.value)
-                            except:
-                                pass
-                        adjusted_width = (max_length + 2)
-                        worksheet.column_dimensions[column].width = adjusted_width
-                
+            # The frames are a snapshot, so the slow file write can run off the Tk thread
+            if self.export_button is not None:
+                self.export_button.configure(state="disabled")
+            threading.Thread(target=self._write_excel, args=(file_path, df_habits, df_tasks),
+                             daemon=True).start()
+
+        except Exception as e:
+            self._export_finished(file_path=None, error=e)
+
+    def _write_excel(self, file_path, df_habits, df_tasks):
+        """Write the export sheets on a worker thread, then report back on the Tk thread."""
+        error = None
+        try:
+            # Write to Excel with column widths taken from the frames, not from the written cells
+            with self._pd.ExcelWriter(file_path, engine='xlsxwriter') as writer:
+                for sheet_name, df in (('Odatlar', df_habits), ('Vazifalar', df_tasks)):
+                    df.to_excel(writer, sheet_name=sheet_name, index=False)
+                    worksheet = writer.sheets[sheet_name]
+                    for col_idx, col in enumerate(df.columns):
+                        lengths = df[col].astype(str).str.len()
+                        max_length = max(len(str(col)), int(lengths.max()) if len(lengths) else 0)
+                        worksheet.set_column(col_idx, col_idx, max_length + 2)
+        except Exception as e:
+            error = e
+        self.after(0, self._export_finished, file_path, error)
+
+    def _export_finished(self, file_path, error):
+        """Re-enable the export button and show the outcome of an export."""
+        if self.export_button is not None:
+            self.export_button.configure(state="normal")
+
+        if error is None:
             messagebox.showinfo("Muvaffaqiyatli", f"Ma'lumotlar saqlandi:\n{file_path}")
             logger.info(f"Exported data to {file_path}")
-            
-        except ImportError:
-            import tkinter.messagebox as messagebox
-            messagebox.showerror("Xatolik", "Excel ga yuklash uchun qaramliklar o'rnatilmagan (pandas, openpyxl). Iltimos, dasturni qayta ishga tushiring yoki terminalda 'pip install pandas openpyxl' deb yozing.")
-            logger.error("Missing pandas or openpyxl for export")
-        except Exception as e:
-            import tkinter.messagebox as messagebox
-            messagebox.showerror("Xatolik", f"Eksport qilishda xatolik yuz berdi: {e}")
-            logger.error(f"Export error: {e}")
+        elif isinstance(error, ImportError):
+            messagebox.showerror("Xatolik", "Excel ga yuklash uchun qaramliklar o'rnatilmagan (pandas, xlsxwriter). Iltimos, dasturni qayta ishga tushiring yoki terminalda 'pip install pandas xlsxwriter' deb yozing.")
+            logger.error("Missing pandas or xlsxwriter for export")
+        else:
+            messagebox.showerror("Xatolik", f"Eksport qilishda xatolik yuz berdi: {error}")
+            logger.error(f"Export error: {error}")
 
 
 if __name__ == "__main__":